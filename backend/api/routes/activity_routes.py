@@ -1,22 +1,85 @@
-from typing import List
-from fastapi import APIRouter, Query
+from typing import List, Optional
+from fastapi import APIRouter, Query, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
-from backend.models.activity import Activity, ActivityCreate
+from backend.models.activity import Activity, ActivityCreate, ActivityPage
 from backend.storage.file_storage import file_storage as storage
 import json
 import asyncio
+import hashlib
+from contextlib import contextmanager
 from datetime import datetime
 
 router = APIRouter()
 
 
+def _etag(activities: List[Activity], *extra) -> str:
+    """ETag for a list of activities. Activities never change once recorded, so their ids identify the content.
+
+    The tag is weak because GZipMiddleware may compress the same response differently.
+    """
+    key = ",".join([activity.id for activity in activities] + [str(part) for part in extra])
+    return 'W/"' + hashlib.sha1(key.encode()).hexdigest() + '"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """Whether If-None-Match names etag (weak comparison, so a W/ prefix on either side is ignored)"""
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in request.headers.get("if-none-match", "").split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag in ("*", opaque):
+            return True
+    return False
+
+
+@contextmanager
+def _activity_queue():
+    """Queue that receives every activity created while the context is open"""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    # Activities can be created from threadpool routes, so they are handed to the loop thread
+    def listener(activity: Activity):
+        loop.call_soon_threadsafe(queue.put_nowait, activity)
+
+    storage.add_activity_listener(listener)
+    try:
+        yield queue
+    finally:
+        storage.remove_activity_listener(listener)
+
+
 @router.get("/", response_model=List[Activity])
 async def get_activities(
+    request: Request,
+    response: Response,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0)
 ) -> List[Activity]:
     """Get activity feed (polling endpoint)"""
-    return storage.list_activities(limit=limit, offset=offset)
+    activities = storage.list_activities(limit=limit, offset=offset)
+    etag = _etag(activities)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return activities
+
+
+@router.get("/page", response_model=ActivityPage)
+async def get_activities_page(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="ID of the last activity of the previous page")
+) -> ActivityPage:
+    """Get one page of the activity feed, newest first, for incremental loading"""
+    items, next_cursor = storage.list_activities_page(limit=limit, cursor=cursor)
+    etag = _etag(items, next_cursor)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return ActivityPage(items=items, next_cursor=next_cursor)
 
 
 @router.get("/stream")
@@ -24,34 +87,25 @@ async def stream_activities():
     """Server-Sent Events endpoint for real-time activity updates"""
     
     async def event_generator():
-        last_check = datetime.utcnow()
-        
-        while True:
-            # Get recent activities
-            activities = storage.list_activities(limit=50)
-            new_activities = [
-                activity for activity in activities 
-                if activity.created_at > last_check
-            ]
-            
-            if new_activities:
-                for activity in new_activities:
-                    data = {
-                        "id": activity.id,
-                        "type": activity.type.value,
-                        "title": activity.title,
-                        "description": activity.description,
-                        "created_at": activity.created_at.isoformat(),
-                        "success": activity.success
-                    }
-                    yield f"data: {json.dumps(data)}\n\n"
-                
-                last_check = new_activities[0].created_at
-            
-            # Send heartbeat
-            yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': datetime.utcnow().isoformat()})}\n\n"
-            
-            await asyncio.sleep(2)  # Check every 2 seconds
+        # Activities are pushed as they are created rather than polled from storage
+        with _activity_queue() as queue:
+            while True:
+                try:
+                    activity = await asyncio.wait_for(queue.get(), timeout=2)
+                except asyncio.TimeoutError:
+                    # Send heartbeat while idle
+                    yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': datetime.utcnow().isoformat()})}\n\n"
+                    continue
+
+                data = {
+                    "id": activity.id,
+                    "type": activity.type.value,
+                    "title": activity.title,
+                    "description": activity.description,
+                    "created_at": activity.created_at.isoformat(),
+                    "success": activity.success
+                }
+                yield f"data: {json.dumps(data)}\n\n"
     
     return StreamingResponse(
         event_generator(),
@@ -65,6 +119,34 @@ async def stream_activities():
     )
 
 
+@router.websocket("/ws")
+async def activities_websocket(websocket: WebSocket):
+    """WebSocket endpoint that pushes each new activity as soon as it is recorded"""
+    # Subscribed before accepting so nothing recorded once the client is connected is missed
+    with _activity_queue() as queue:
+        await websocket.accept()
+
+        # Finishes when the client disconnects; anything the client sends is ignored
+        receiver = asyncio.ensure_future(websocket.receive_text())
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait({getter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+
+                if getter in done:
+                    await websocket.send_json(getter.result().model_dump(mode="json"))
+                else:
+                    getter.cancel()
+
+                if receiver in done:
+                    receiver.result()
+                    receiver = asyncio.ensure_future(websocket.receive_text())
+        except WebSocketDisconnect:
+            pass
+        finally:
+            receiver.cancel()
+
+
 @router.post("/", response_model=Activity)
 async def create_activity(activity_data: ActivityCreate) -> Activity:
     """Create a new activity (used internally by the system)"""
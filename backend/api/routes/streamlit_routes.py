@@ -17,9 +17,8 @@ client = httpx.AsyncClient(timeout=30.0)
 async def streamlit_root():
     """Redirect to the Streamlit app or show embedded version"""
     if not streamlit_runner.is_running:
+        # start() returns once the app accepts connections (or has given up)
         streamlit_runner.start()
-        import asyncio
-        await asyncio.sleep(2)  # Give Streamlit time to start
     
     # Return an HTML page that embeds the Streamlit app in an iframe
     html_content = f"""
@@ -182,9 +181,8 @@ async def start_streamlit():
     if streamlit_runner.is_running:
         return {"message": "Streamlit is already running", "url": streamlit_runner.get_url()}
     
+    # start() returns once the app accepts connections (or has given up)
     streamlit_runner.start()
-    import asyncio
-    await asyncio.sleep(2)  # Give it time to start
     
     if streamlit_runner.is_running:
         return {"message": "Streamlit started successfully", "url": streamlit_runner.get_url()}
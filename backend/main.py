@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, HTMLResponse
 from pathlib import Path
@@ -16,8 +17,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets cross-origin pages (e.g. the Streamlit components) read it for If-None-Match
+    expose_headers=["ETag"],
 )
 
+# JSON lists such as the activity feed are highly repetitive and compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include API routers
 app.include_router(agent_routes.router, prefix="/api/agents", tags=["agents"])
 app.include_router(workflow_routes.router, prefix="/api/workflows", tags=["workflows"])
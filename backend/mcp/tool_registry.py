@@ -1,9 +1,57 @@
-from typing import Dict, List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 from backend.models.mcp_tool import MockMCPTool, MCPTool
 from backend.mcp.tools.email_tool import EmailTool
 from backend.mcp.tools.slack_tool import SlackTool
 from backend.mcp.tools.file_tool import FileTool
 
+# Compiled once for every response parsed
+_TOOL_CALL_RE = re.compile(r'TOOL_CALL:(\w+):(\w+):')
+
+
+def _extract_json_object(text: str, start: int) -> Optional[str]:
+    """Return the JSON object opening at text[start], or None if it is never closed"""
+    depth = 0
+    in_string = escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def parse_tool_calls(response: str) -> List[Tuple[str, str, str]]:
+    """Find TOOL_CALL:tool_name:action:{parameters} calls in an LLM response.
+
+    The parameters are matched by brace depth (ignoring braces inside strings) in one
+    pass, so nested objects come back whole instead of cut at the first '}'.
+    """
+    calls = []
+    end = 0
+    for match in _TOOL_CALL_RE.finditer(response):
+        if match.start() < end or not response.startswith('{', match.end()):
+            continue
+        params_json = _extract_json_object(response, match.end())
+        if params_json is None:
+            # Unclosed parameters; a later header may still hold a complete call
+            continue
+        end = match.end() + len(params_json)
+        calls.append((match.group(1), match.group(2), params_json))
+    return calls
+
 
 class ToolRegistry:
     """Registry for managing MCP tools"""
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 from backend.models.base import TimestampMixin, ActivityType
 
@@ -25,4 +25,9 @@ class ActivityCreate(BaseModel):
     description: str
     data: Dict[str, Any] = Field(default_factory=dict)
     success: bool = True
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None
+
+
+class ActivityPage(BaseModel):
+    items: List[Activity]
+    next_cursor: Optional[str] = Field(None, description="ID to pass as cursor for the next page, if there is one")
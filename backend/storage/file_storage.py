@@ -1,7 +1,7 @@
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import uuid
 from backend.models.agent import Agent, AgentCreate, AgentUpdate
@@ -20,6 +20,9 @@ class FileStorage:
         self.activities_file = self.data_dir / "activities.json"
         self.tool_actions_file = self.data_dir / "tool_actions.json"
         
+        # Called with each activity as it is created (live activity feeds)
+        self._activity_listeners: List[Callable[[Activity], None]] = []
+        
         # Create directories if they don't exist
         self._init_storage()
         
@@ -197,8 +200,18 @@ class FileStorage:
             activities = activities[-1000:]
         
         self._write_json(self.activities_file, activities)
+        for listener in list(self._activity_listeners):
+            listener(activity)
         return activity
     
+    def add_activity_listener(self, listener: Callable[[Activity], None]):
+        """Call listener with every activity created from now on"""
+        self._activity_listeners.append(listener)
+    
+    def remove_activity_listener(self, listener: Callable[[Activity], None]):
+        """Stop calling a listener added with add_activity_listener"""
+        self._activity_listeners.remove(listener)
+    
     def list_activities(self, limit: int = 100, offset: int = 0) -> List[Activity]:
         """List recent activities with pagination support"""
         activities_data = self._read_json(self.activities_file) or []
@@ -215,6 +228,23 @@ class FileStorage:
         activities = [Activity(**data) for data in paginated_activities]
         return activities
     
+    def list_activities_page(self, limit: int = 100, cursor: Optional[str] = None) -> Tuple[List[Activity], Optional[str]]:
+        """List activities newest first, starting after the activity with id `cursor`.
+
+        Returns the page and the cursor for the next one (None on the last page).
+        """
+        activities_data = list(reversed(self._read_json(self.activities_file) or []))
+
+        start = 0
+        if cursor:
+            # An unknown cursor (e.g. trimmed from the log) means there is nothing older
+            start = next((i + 1 for i, data in enumerate(activities_data) if data["id"] == cursor),
+                         len(activities_data))
+        page = activities_data[start:start + limit]
+        next_cursor = page[-1]["id"] if page and start + limit < len(activities_data) else None
+
+        return [Activity(**data) for data in page], next_cursor
+    
     def get_activities_by_agent(self, agent_id: str, limit: int = 50) -> List[Activity]:
         """Get activities for a specific agent"""
         all_activities = self.list_activities(limit=500)  # Get more to filter
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 import uuid
 from datetime import datetime
 from backend.models.agent import Agent, AgentCreate, AgentUpdate
@@ -16,6 +16,7 @@ class InMemoryStorage:
         self.workflow_executions: Dict[str, WorkflowExecution] = {}
         self.activities: Dict[str, Activity] = {}
         self.mcp_tool_actions: Dict[str, MCPToolAction] = {}
+        self._activity_listeners: List[Callable[[Activity], None]] = []
     
     # Agent operations
     def create_agent(self, agent_data: AgentCreate) -> Agent:
@@ -86,11 +87,28 @@ class InMemoryStorage:
         activity_id = str(uuid.uuid4())
         activity = Activity(id=activity_id, **activity_data.dict())
         self.activities[activity_id] = activity
+        for listener in list(self._activity_listeners):
+            listener(activity)
         return activity
     
+    def add_activity_listener(self, listener: Callable[[Activity], None]):
+        self._activity_listeners.append(listener)
+    
+    def remove_activity_listener(self, listener: Callable[[Activity], None]):
+        self._activity_listeners.remove(listener)
+    
     def list_activities(self, limit: int = 100, offset: int = 0) -> List[Activity]:
         activities = sorted(self.activities.values(), key=lambda x: x.created_at, reverse=True)
         return activities[offset:offset + limit]
+    
+    def list_activities_page(self, limit: int = 100, cursor: Optional[str] = None) -> Tuple[List[Activity], Optional[str]]:
+        activities = sorted(self.activities.values(), key=lambda x: x.created_at, reverse=True)
+        start = 0
+        if cursor:
+            start = next((i + 1 for i, a in enumerate(activities) if a.id == cursor), len(activities))
+        page = activities[start:start + limit]
+        next_cursor = page[-1].id if page and start + limit < len(activities) else None
+        return page, next_cursor
 
 
 # Global storage instance
@@ -50,11 +50,13 @@ class StreamlitRunner:
         self.thread = threading.Thread(target=self._run_streamlit, daemon=True)
         self.thread.start()
         
-        # Wait for Streamlit to start
-        max_wait = 10  # seconds
-        start_time = time.time()
-        while self.is_port_available(self.port) and (time.time() - start_time) < max_wait:
-            time.sleep(0.5)
+        # Wait for Streamlit to start, checking often at first so a quick start is seen
+        # right away, then backing off to every 0.5s
+        deadline = time.monotonic() + 10  # seconds
+        delay = 0.05
+        while self.is_port_available(self.port) and time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
         
         if self.is_port_available(self.port):
             logger.error("Failed to start Streamlit app")
@@ -5,7 +5,7 @@ from backend.models.workflow import Workflow, WorkflowNode, WorkflowEdge, Workfl
 from backend.models.agent import Agent
 from backend.models.activity import ActivityCreate, ActivityType
 from backend.storage.file_storage import file_storage as storage
-from backend.mcp.tool_registry import tool_registry
+from backend.mcp.tool_registry import tool_registry, parse_tool_calls
 from backend.llm.factory import llm_provider
 from backend.llm.base import LLMMessage, LLMRole
 
@@ -310,12 +310,7 @@ class WorkflowExecutor:
         """Parse and execute tool calls from LLM response"""
         tool_results = []
         
-        # Simple parsing for TOOL_CALL:tool_name:action:{parameters}
-        import re
-        pattern = r'TOOL_CALL:(\w+):(\w+):(\{.*?\})'
-        matches = re.findall(pattern, response, re.DOTALL)
-        
-        for tool_id, action, params_json in matches:
+        for tool_id, action, params_json in parse_tool_calls(response):
             # Find the tool
             tool = None
             for available_tool in available_tools:
@@ -1,10 +1,17 @@
 """Backend-integrated agent builder with full API connectivity"""
+from functools import lru_cache
+
 import streamlit.components.v1 as components
 
+
 def agent_builder_integrated(key="agent_builder_integrated", height=700):
     """Backend-integrated Streamlit agent builder"""
-    
-    component_html = f"""
+    return components.html(_component_html(height), height=height, scrolling=False)
+
+
+@lru_cache(maxsize=8)
+def _component_html(height):
+    return f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -109,6 +116,9 @@ def agent_builder_integrated(key="agent_builder_integrated", height=700):
         </div>
         
         <script>
+            // Shared across every apiCall so requests don't rebuild headers
+            const COMMON_HEADERS = new Headers({{ 'Content-Type': 'application/json' }});
+            
             window.AgentBuilder = {{
                 agents: [],
                 apiBase: 'http://localhost:8003/api',
@@ -123,7 +133,7 @@ def agent_builder_integrated(key="agent_builder_integrated", height=700):
                     try {{
                         const url = this.apiBase + endpoint;
                         const response = await fetch(url, {{
-                            headers: {{ 'Content-Type': 'application/json' }},
+                            headers: COMMON_HEADERS,
                             ...options
                         }});
                         
@@ -358,5 +368,3 @@ def agent_builder_integrated(key="agent_builder_integrated", height=700):
     </body>
     </html>
     """
-    
-    return components.html(component_html, height=height, scrolling=False)
\ No newline at end of file
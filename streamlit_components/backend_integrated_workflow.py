@@ -1,10 +1,24 @@
 """Backend-integrated workflow editor with full API connectivity"""
+from functools import lru_cache
+from pathlib import Path
+
 import streamlit.components.v1 as components
 
+# Inlined into the page, which is rendered through components.html and can't load it by URL
+_OFF_THREAD_JS = (
+    Path(__file__).parent / "react_components_frontend" / "common" / "offthread.js"
+).read_text()
+
+
 def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
     """Backend-integrated Streamlit workflow editor"""
-    
-    component_html = f"""
+    return components.html(_component_html(height), height=height, scrolling=False)
+
+
+# The page only depends on the height; the few heights in use each keep their rendered page
+@lru_cache(maxsize=8)
+def _component_html(height):
+    return f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -20,6 +34,9 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
             #workflow-root {{ width: 100%; height: {height - 20}px; overflow: hidden; }}
             .workflow-node {{
                 position: absolute;
+                left: 0;
+                top: 0;
+                will-change: transform;
                 background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
                 color: white;
                 border-radius: 8px;
@@ -28,7 +45,7 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                 user-select: none;
                 cursor: move;
             }}
-            .workflow-node:hover {{ box-shadow: 0 6px 12px rgba(0,0,0,0.15); transform: translateY(-1px); }}
+            .workflow-node:hover {{ box-shadow: 0 6px 12px rgba(0,0,0,0.15); }}
             .node-handle {{
                 position: absolute;
                 width: 12px;
@@ -41,6 +58,7 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
             .input-handle {{ left: -8px; top: 50%; transform: translateY(-50%); background: #10b981; }}
             .output-handle {{ right: -8px; top: 50%; transform: translateY(-50%); background: #3b82f6; }}
             .node-handle:hover {{ transform: translateY(-50%) scale(1.3); box-shadow: 0 2px 8px rgba(0,0,0,0.3); }}
+            .connecting .input-handle:hover {{ background: #059669; transform: translateY(-50%) scale(1.4); }}
             .connection-line {{ stroke: #6366f1; stroke-width: 2; fill: none; marker-end: url(#arrowhead); }}
             .temp-connection {{ stroke: #94a3b8; stroke-width: 2; stroke-dasharray: 5,5; fill: none; }}
             .agent-item {{
@@ -167,13 +185,40 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                             
                             <!-- Nodes container -->
                             <div id="nodes-container" style="position: absolute; width: 100%; height: 100%; z-index: 2;"></div>
+                            
+                            <template id="wf-node-tpl">
+                                <div class="workflow-node" style="width: 180px; height: 70px; display: flex; align-items: center; justify-content: center;">
+                                    <div class="node-handle input-handle" data-handle="input"></div>
+                                    <div style="text-align: center; pointer-events: none;">
+                                        <div class="wf-label" style="font-weight: bold; font-size: 12px;"></div>
+                                        <div class="wf-id" style="font-size: 9px; opacity: 0.8;"></div>
+                                    </div>
+                                    <div class="node-handle output-handle" data-handle="output"></div>
+                                </div>
+                            </template>
                         </div>
                     </div>
                 </div>
             </div>
         </div>
         
+        <script>{_OFF_THREAD_JS}</script>
         <script>
+            // Shared across every apiCall so requests don't rebuild headers
+            const COMMON_HEADERS = new Headers({{ 'Content-Type': 'application/json' }});
+            const BEZIER_CACHE_SIZE = 512;
+            
+            // Trailing-edge debounce: only the last call in a burst runs, `wait` ms after it
+            function debounce(fn, wait) {{
+                let timer = 0;
+                return (...args) => {{
+                    clearTimeout(timer);
+                    timer = setTimeout(() => fn(...args), wait);
+                }};
+            }}
+            // Rendered node box (180x70 plus a 2px border) and how far handles sit inside it
+            const NODE_W = 184, NODE_H = 74, HANDLE_INSET = 8;
+            
             window.WorkflowEditor = {{
                 // Data
                 nodes: [],
@@ -184,11 +229,25 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                 currentWorkflowName: 'New Workflow',
                 
                 // State
-                isDragging: false,
                 isConnecting: false,
                 connectionMode: false,
                 connectionStart: null,
                 dragOffset: {{ x: 0, y: 0 }},
+                _drag: null,
+                renderWorkflowsListDebounced: null,
+                _idc: 0,
+                canvasEl: null,
+                _canvasRect: null,
+                _edgePaths: new Map(),
+                _pathPool: [],
+                _bezCache: new Map(),
+                _edgesByNode: new Map(),
+                _nodeIndex: new Map(),
+                _nodeMeta: new Map(),
+                _posX: new Float32Array(64),
+                _posY: new Float32Array(64),
+                _agentById: new Map(),
+                _adj: new Map(),
                 
                 // Config
                 apiBase: 'http://localhost:8003/api',
@@ -196,12 +255,21 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                 // Initialization
                 init: function() {{
                     console.log('Backend-Integrated Workflow Editor initialized');
+                    this._idc = 0;
+                    this.renderWorkflowsListDebounced = debounce(() => this.renderWorkflowsList(), 120);
                     this.setupEventListeners();
                     this.refreshData();
                 }},
                 
                 setupEventListeners: function() {{
                     const canvas = document.getElementById('workflow-canvas');
+                    this.canvasEl = canvas;
+                    
+                    // The cached canvas rect is only stale once the viewport moves
+                    const invalidate = () => {{ this._canvasRect = null; }};
+                    window.addEventListener('resize', invalidate, {{ passive: true }});
+                    window.addEventListener('scroll', invalidate, {{ passive: true, capture: true }});
+                    
                     canvas.addEventListener('mousemove', (e) => {{
                         if (this.isConnecting && this.connectionStart) {{
                             this.updateTempConnection(e);
@@ -210,6 +278,27 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                     canvas.addEventListener('mouseup', () => {{
                         if (this.isConnecting) this.cancelConnection();
                     }});
+                    
+                    // One set of listeners serves every node, however many are loaded
+                    const nodesContainer = document.getElementById('nodes-container');
+                    nodesContainer.addEventListener('mousedown', (e) => {{
+                        const node = e.target.closest('.workflow-node');
+                        if (!node) return;
+                        if (e.target.classList.contains('node-handle')) {{
+                            if (e.target.dataset.handle === 'output') this.startConnection(node.id, 'output', e);
+                            return;
+                        }}
+                        this.startDrag(node, e);
+                    }});
+                    nodesContainer.addEventListener('mouseup', (e) => {{
+                        if (!this.isConnecting || !e.target.classList.contains('input-handle')) return;
+                        e.stopPropagation();
+                        this.endConnection(e.target.closest('.workflow-node').id, 'input');
+                    }});
+                    document.addEventListener('mousemove', (e) => {{
+                        if (this._drag) this.moveDrag(e);
+                    }});
+                    document.addEventListener('mouseup', () => this.endDrag());
                 }},
                 
                 // API Functions
@@ -217,7 +306,7 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                     try {{
                         const url = this.apiBase + endpoint;
                         const response = await fetch(url, {{
-                            headers: {{ 'Content-Type': 'application/json' }},
+                            headers: COMMON_HEADERS,
                             ...options
                         }});
                         
@@ -274,15 +363,20 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                     const agents = await this.apiCall('/agents');
                     if (agents) {{
                         this.agents = agents;
+                        this._agentById = new Map(agents.map(a => [a.id, a]));
                         this.renderAgentsList();
                     }}
                 }},
                 
-                async loadWorkflows() {{
+                async loadWorkflows(deferRender = false) {{
                     const workflows = await this.apiCall('/workflows');
                     if (workflows) {{
                         this.workflows = workflows;
-                        this.renderWorkflowsList();
+                        if (deferRender) {{
+                            this.renderWorkflowsListDebounced();
+                        }} else {{
+                            this.renderWorkflowsList();
+                        }}
                     }}
                 }},
                 
@@ -354,113 +448,91 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                 // Node Management
                 addAgentNode: function(agentId, agentName) {{
                     const container = document.getElementById('nodes-container');
-                    const nodeId = 'node-' + Date.now();
+                    const nodeId = 'n' + (++this._idc);
                     
-                    const nodeDiv = document.createElement('div');
-                    nodeDiv.id = nodeId;
-                    nodeDiv.className = 'workflow-node';
-                    nodeDiv.style.cssText = `
-                        width: 180px; height: 70px;
-                        left: ${{100 + Math.random() * 250}}px;
-                        top: ${{80 + Math.random() * 200}}px;
-                        display: flex; align-items: center; justify-content: center;
-                    `;
+                    const x = Math.round(100 + Math.random() * 250);
+                    const y = Math.round(80 + Math.random() * 200);
                     
-                    const emoji = this.getAgentEmoji(agentName);
-                    nodeDiv.innerHTML = `
-                        <div class="node-handle input-handle" data-node-id="${{nodeId}}" data-handle="input"></div>
-                        <div style="text-align: center; pointer-events: none;">
-                            <div style="font-weight: bold; font-size: 12px;">${{emoji}} ${{agentName}}</div>
-                            <div style="font-size: 9px; opacity: 0.8;">${{nodeId.substring(5, 11)}}</div>
-                        </div>
-                        <div class="node-handle output-handle" data-node-id="${{nodeId}}" data-handle="output"></div>
-                    `;
+                    container.appendChild(this.createNodeElement(nodeId, agentName, x, y));
                     
-                    this.makeNodeDraggable(nodeDiv);
-                    this.addNodeConnectionHandlers(nodeDiv);
-                    container.appendChild(nodeDiv);
-                    
-                    // Store node data with agent reference
-                    this.nodes.push({{
-                        id: nodeId,
-                        agent_id: agentId,
-                        agent_name: agentName,
-                        position: {{ 
-                            x: parseInt(nodeDiv.style.left), 
-                            y: parseInt(nodeDiv.style.top) 
-                        }}
-                    }});
+                    this.registerNode(nodeId, agentId, agentName, x, y);
                     
                     document.getElementById('empty-state').style.display = 'none';
                     console.log('Added agent node:', nodeId, agentName);
                 }},
                 
+                // Clone the static node markup instead of parsing an HTML string per node
+                createNodeElement: function(nodeId, agentName, x, y) {{
+                    const nodeDiv = document.getElementById('wf-node-tpl').content.firstElementChild.cloneNode(true);
+                    nodeDiv.id = nodeId;
+                    nodeDiv.style.transform = `translate3d(${{x}}px, ${{y}}px, 0)`;
+                    nodeDiv.querySelector('.input-handle').dataset.nodeId = nodeId;
+                    nodeDiv.querySelector('.output-handle').dataset.nodeId = nodeId;
+                    nodeDiv.querySelector('.wf-label').textContent = `${{this.getAgentEmoji(agentName)}} ${{agentName}}`;
+                    nodeDiv.querySelector('.wf-id').textContent = this.shortId(nodeId);
+                    return nodeDiv;
+                }},
+                
+                // Ids saved by older editors look like 'node-<timestamp>'; newer ones are 'n<counter>'
+                shortId: function(id) {{
+                    return id.startsWith('node-') ? id.substring(5, 11) : id;
+                }},
+                
+                // Keep the counter ahead of ids loaded from a saved workflow
+                reserveId: function(id) {{
+                    const m = /^[ne](\\d+)$/.exec(id);
+                    if (m && +m[1] > this._idc) this._idc = +m[1];
+                }},
+                
                 // Node interaction (dragging, connections) - keeping existing logic
-                makeNodeDraggable: function(nodeElement) {{
-                    let isDragging = false;
-                    
-                    nodeElement.addEventListener('mousedown', (e) => {{
-                        if (e.target.classList.contains('node-handle')) return;
-                        
-                        if (this.connectionMode) {{
-                            this.handleNodeClick(nodeElement.id);
-                            return;
-                        }}
-                        
-                        isDragging = true;
-                        this.dragOffset.x = e.clientX - nodeElement.offsetLeft;
-                        this.dragOffset.y = e.clientY - nodeElement.offsetTop;
-                        nodeElement.style.zIndex = '1000';
-                    }});
-                    
-                    document.addEventListener('mousemove', (e) => {{
-                        if (isDragging) {{
-                            const newX = Math.max(0, e.clientX - this.dragOffset.x);
-                            const newY = Math.max(0, e.clientY - this.dragOffset.y);
-                            
-                            nodeElement.style.left = newX + 'px';
-                            nodeElement.style.top = newY + 'px';
-                            
-                            this.updateNodePosition(nodeElement.id, newX, newY);
-                            this.redrawConnections();
-                        }}
-                    }});
+                startDrag: function(nodeElement, e) {{
+                    if (this.connectionMode) {{
+                        this.handleNodeClick(nodeElement.id);
+                        return;
+                    }}
                     
-                    document.addEventListener('mouseup', () => {{
-                        if (isDragging) {{
-                            isDragging = false;
-                            nodeElement.style.zIndex = 'auto';
-                        }}
-                    }});
+                    const pos = this.nodePosition(nodeElement.id);
+                    this.dragOffset.x = e.clientX - pos.x;
+                    this.dragOffset.y = e.clientY - pos.y;
+                    this._drag = {{ el: nodeElement, pending: null, frame: 0 }};
+                    nodeElement.style.zIndex = '1000';
                 }},
                 
-                addNodeConnectionHandlers: function(nodeElement) {{
-                    const inputHandle = nodeElement.querySelector('.input-handle');
-                    const outputHandle = nodeElement.querySelector('.output-handle');
-                    
-                    outputHandle.addEventListener('mousedown', (e) => {{
-                        e.stopPropagation();
-                        this.startConnection(nodeElement.id, 'output', e);
-                    }});
-                    
-                    inputHandle.addEventListener('mouseup', (e) => {{
-                        e.stopPropagation();
-                        if (this.isConnecting) {{
-                            this.endConnection(nodeElement.id, 'input');
-                        }}
-                    }});
+                moveDrag: function(e) {{
+                    const drag = this._drag;
+                    drag.pending = {{
+                        x: Math.max(0, e.clientX - this.dragOffset.x),
+                        y: Math.max(0, e.clientY - this.dragOffset.y)
+                    }};
+                    if (!drag.frame) drag.frame = requestAnimationFrame(() => this.applyDrag(drag));
+                }},
+                
+                // Apply only the latest pointer position once per frame
+                applyDrag: function(drag) {{
+                    drag.frame = 0;
+                    if (!drag.pending) return;
+                    const {{ x, y }} = drag.pending;
+                    drag.pending = null;
                     
-                    inputHandle.addEventListener('mouseenter', () => {{
-                        if (this.isConnecting) {{
-                            inputHandle.style.background = '#059669';
-                            inputHandle.style.transform = 'translateY(-50%) scale(1.4)';
-                        }}
-                    }});
+                    // Moving by transform stays on the compositor instead of relaying out the canvas
+                    drag.el.style.transform = `translate3d(${{x}}px, ${{y}}px, 0)`;
                     
-                    inputHandle.addEventListener('mouseleave', () => {{
-                        inputHandle.style.background = '#10b981';
-                        inputHandle.style.transform = 'translateY(-50%) scale(1)';
-                    }});
+                    this.updateNodePosition(drag.el.id, x, y);
+                    this.redrawConnectionsForNode(drag.el.id);
+                }},
+                
+                endDrag: function() {{
+                    const drag = this._drag;
+                    if (!drag) return;
+                    this._drag = null;
+                    // Land the final position even if its frame hasn't run yet
+                    if (drag.frame) {{
+                        cancelAnimationFrame(drag.frame);
+                        this.applyDrag(drag);
+                    }}
+                    drag.el.style.zIndex = 'auto';
+                    // Sync the saved position once per drag rather than on every move
+                    this._nodeMeta.get(drag.el.id).node.position = this.nodePosition(drag.el.id);
                 }},
                 
                 // Connection handling - keeping existing connection logic but updating data structure
@@ -468,11 +540,12 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                     e.preventDefault();
                     this.isConnecting = true;
                     this.connectionStart = {{ nodeId, handleType }};
+                    document.getElementById('nodes-container').classList.add('connecting');
                     
                     const svg = document.getElementById('connections-svg');
                     const tempLine = document.createElementNS('http://www.w3.org/2000/svg', 'path');
                     tempLine.id = 'temp-connection';
-                    tempLine.className = 'temp-connection';
+                    tempLine.setAttribute('class', 'temp-connection');
                     svg.appendChild(tempLine);
                 }},
                 
@@ -482,17 +555,14 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                         return;
                     }}
                     
-                    const edgeId = 'edge-' + Date.now();
+                    const edgeId = 'e' + (++this._idc);
                     const edge = {{
                         id: edgeId,
-                        source: this.connectionStart.nodeId,
-                        target: targetNodeId,
                         source_node_id: this.connectionStart.nodeId,
                         target_node_id: targetNodeId
                     }};
                     
-                    this.edges.push(edge);
-                    this.drawConnection(edge);
+                    this.addEdge(edge);
                     this.cancelConnection();
                     
                     console.log('Created connection:', edge);
@@ -501,6 +571,7 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                 cancelConnection: function() {{
                     this.isConnecting = false;
                     this.connectionStart = null;
+                    document.getElementById('nodes-container').classList.remove('connecting');
                     const tempLine = document.getElementById('temp-connection');
                     if (tempLine) tempLine.remove();
                 }},
@@ -509,12 +580,11 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                     const tempLine = document.getElementById('temp-connection');
                     if (!tempLine || !this.connectionStart) return;
                     
-                    const sourceNode = document.getElementById(this.connectionStart.nodeId);
-                    const sourceRect = sourceNode.getBoundingClientRect();
-                    const canvasRect = document.getElementById('workflow-canvas').getBoundingClientRect();
+                    const sourcePos = this.nodePosition(this.connectionStart.nodeId);
+                    const canvasRect = this.getCanvasRect();
                     
-                    const startX = sourceRect.right - canvasRect.left - 8;
-                    const startY = sourceRect.top + sourceRect.height/2 - canvasRect.top;
+                    const startX = sourcePos.x + NODE_W - HANDLE_INSET;
+                    const startY = sourcePos.y + NODE_H / 2;
                     const endX = e.clientX - canvasRect.left;
                     const endY = e.clientY - canvasRect.top;
                     
@@ -539,15 +609,12 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                         node.style.border = '3px solid #f59e0b';
                     }} else if (this.connectionStart.nodeId !== nodeId) {{
                         const edge = {{
-                            id: 'edge-' + Date.now(),
-                            source: this.connectionStart.nodeId,
-                            target: nodeId,
+                            id: 'e' + (++this._idc),
                             source_node_id: this.connectionStart.nodeId,
                             target_node_id: nodeId
                         }};
                         
-                        this.edges.push(edge);
-                        this.drawConnection(edge);
+                        this.addEdge(edge);
                         
                         const sourceNode = document.getElementById(this.connectionStart.nodeId);
                         sourceNode.style.border = '2px solid #4f46e5';
@@ -555,57 +622,147 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                     }}
                 }},
                 
+                addEdge: function(edge) {{
+                    const source = edge.source_node_id;
+                    const target = edge.target_node_id;
+                    this.edges.push(edge);
+                    for (const nodeId of [source, target]) {{
+                        let list = this._edgesByNode.get(nodeId);
+                        if (!list) this._edgesByNode.set(nodeId, list = []);
+                        list.push(edge);
+                    }}
+                    let next = this._adj.get(source);
+                    if (!next) this._adj.set(source, next = []);
+                    next.push(target);
+                    this.drawConnection(edge);
+                }},
+                
                 drawConnection: function(edge) {{
                     const svg = document.getElementById('connections-svg');
-                    const sourceNode = document.getElementById(edge.source || edge.source_node_id);
-                    const targetNode = document.getElementById(edge.target || edge.target_node_id);
+                    const sourceId = edge.source_node_id;
+                    const targetId = edge.target_node_id;
                     
-                    if (!sourceNode || !targetNode) return;
+                    if (!this._nodeIndex.has(sourceId) || !this._nodeIndex.has(targetId)) return;
                     
-                    const line = document.createElementNS('http://www.w3.org/2000/svg', 'path');
+                    const line = this.acquirePath(svg);
                     line.id = edge.id;
-                    line.className = 'connection-line';
                     
-                    this.updateConnectionPath(line, sourceNode, targetNode);
-                    svg.appendChild(line);
+                    this.updateConnectionPath(line, this.nodePosition(sourceId), this.nodePosition(targetId));
+                    this._edgePaths.set(edge.id, line);
                 }},
                 
-                updateConnectionPath: function(line, sourceNode, targetNode) {{
-                    const sourceRect = sourceNode.getBoundingClientRect();
-                    const targetRect = targetNode.getBoundingClientRect();
-                    const canvasRect = document.getElementById('workflow-canvas').getBoundingClientRect();
-                    
-                    const startX = sourceRect.right - canvasRect.left - 8;
-                    const startY = sourceRect.top + sourceRect.height/2 - canvasRect.top;
-                    const endX = targetRect.left - canvasRect.left + 8;
-                    const endY = targetRect.top + targetRect.height/2 - canvasRect.top;
+                // Edge paths are recycled across load/clear cycles instead of being recreated
+                acquirePath: function(svg) {{
+                    let line = this._pathPool.pop();
+                    if (line) {{
+                        line.style.display = '';
+                    }} else {{
+                        line = document.createElementNS('http://www.w3.org/2000/svg', 'path');
+                        line.setAttribute('class', 'connection-line');
+                        svg.appendChild(line);
+                    }}
+                    return line;
+                }},
+                
+                releasePath: function(line) {{
+                    line.style.display = 'none';
+                    line.removeAttribute('id');
+                    line.removeAttribute('d');
+                    line.__lastD = undefined;
+                    this._pathPool.push(line);
+                }},
+                
+                updateConnectionPath: function(line, sourcePos, targetPos) {{
+                    // Handles sit at fixed offsets inside the node box, so no layout read is needed
+                    const startX = sourcePos.x + NODE_W - HANDLE_INSET;
+                    const startY = sourcePos.y + NODE_H / 2;
+                    const endX = targetPos.x + HANDLE_INSET;
+                    const endY = targetPos.y + NODE_H / 2;
                     
-                    const path = this.createBezierPath(startX, startY, endX, endY);
-                    line.setAttribute('d', path);
+                    this.setPath(line, this.createBezierPath(startX, startY, endX, endY));
+                }},
+                
+                // Skip the attribute write (and the repaint it triggers) when the path is unchanged
+                setPath: function(line, d) {{
+                    if (line.__lastD !== d) {{
+                        line.setAttribute('d', d);
+                        line.__lastD = d;
+                    }}
+                }},
+                
+                getCanvasRect: function() {{
+                    return this._canvasRect || (this._canvasRect = this.canvasEl.getBoundingClientRect());
                 }},
                 
                 createBezierPath: function(x1, y1, x2, y2) {{
+                    // Whole pixels are indistinguishable on screen and make unchanged edges hit the cache
+                    x1 = Math.round(x1); y1 = Math.round(y1);
+                    x2 = Math.round(x2); y2 = Math.round(y2);
+                    
+                    const key = x1 + ',' + y1 + ',' + x2 + ',' + y2;
+                    let path = this._bezCache.get(key);
+                    if (path !== undefined) {{
+                        // Re-insert so edges that stay put outlive transient temp-connection paths
+                        this._bezCache.delete(key);
+                        this._bezCache.set(key, path);
+                        return path;
+                    }}
+                    
                     const dx = Math.abs(x2 - x1);
                     const offset = Math.min(dx * 0.5, 100);
-                    return `M ${{x1}} ${{y1}} C ${{x1 + offset}} ${{y1}}, ${{x2 - offset}} ${{y2}}, ${{x2}} ${{y2}}`;
+                    path = `M ${{x1}} ${{y1}} C ${{x1 + offset}} ${{y1}}, ${{x2 - offset}} ${{y2}}, ${{x2}} ${{y2}}`;
+                    
+                    if (this._bezCache.size >= BEZIER_CACHE_SIZE) {{
+                        this._bezCache.delete(this._bezCache.keys().next().value);
+                    }}
+                    this._bezCache.set(key, path);
+                    return path;
                 }},
                 
-                redrawConnections: function() {{
-                    this.edges.forEach(edge => {{
-                        const line = document.getElementById(edge.id);
-                        const sourceNode = document.getElementById(edge.source || edge.source_node_id);
-                        const targetNode = document.getElementById(edge.target || edge.target_node_id);
-                        if (line && sourceNode && targetNode) {{
-                            this.updateConnectionPath(line, sourceNode, targetNode);
-                        }}
-                    }});
+                // Only edges touching the node move while it is dragged
+                redrawConnectionsForNode: function(nodeId) {{
+                    const edges = this._edgesByNode.get(nodeId);
+                    if (edges) this.flushConnections(edges);
+                }},
+                
+                flushConnections: function(edges = this.edges) {{
+                    // Endpoints come from the position arrays and fixed node size, so no layout is read
+                    const posX = this._posX, posY = this._posY;
+                    for (const edge of edges) {{
+                        const line = this._edgePaths.get(edge.id);
+                        const s = this._nodeIndex.get(edge.source_node_id);
+                        const t = this._nodeIndex.get(edge.target_node_id);
+                        if (!line || s === undefined || t === undefined) continue;
+                        
+                        this.setPath(line, this.createBezierPath(
+                            posX[s] + NODE_W - HANDLE_INSET,
+                            posY[s] + NODE_H / 2,
+                            posX[t] + HANDLE_INSET,
+                            posY[t] + NODE_H / 2
+                        ));
+                    }}
                 }},
                 
                 updateNodePosition: function(nodeId, x, y) {{
-                    const node = this.nodes.find(n => n.id === nodeId);
-                    if (node) {{
-                        node.position = {{ x, y }};
+                    let i = this._nodeIndex.get(nodeId);
+                    if (i === undefined) {{
+                        i = this._nodeIndex.size;
+                        if (i === this._posX.length) {{
+                            const posX = new Float32Array(i * 2), posY = new Float32Array(i * 2);
+                            posX.set(this._posX);
+                            posY.set(this._posY);
+                            this._posX = posX;
+                            this._posY = posY;
+                        }}
+                        this._nodeIndex.set(nodeId, i);
                     }}
+                    this._posX[i] = x;
+                    this._posY[i] = y;
+                }},
+                
+                nodePosition: function(nodeId) {{
+                    const i = this._nodeIndex.get(nodeId);
+                    return {{ x: this._posX[i], y: this._posY[i] }};
                 }},
                 
                 // Workflow Management
@@ -614,19 +771,22 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                     this.currentWorkflowId = null;
                     this.currentWorkflowName = 'New Workflow';
                     document.getElementById('current-workflow-name').textContent = this.currentWorkflowName;
-                    this.renderWorkflowsList();
+                    this.renderWorkflowsListDebounced();
                 }},
                 
                 clearWorkflow: function() {{
                     const container = document.getElementById('nodes-container');
                     container.innerHTML = '';
                     
-                    const svg = document.getElementById('connections-svg');
-                    const connections = svg.querySelectorAll('.connection-line');
-                    connections.forEach(conn => conn.remove());
+                    this._edgePaths.forEach(line => this.releasePath(line));
+                    this._edgePaths.clear();
                     
                     this.nodes = [];
                     this.edges = [];
+                    this._edgesByNode.clear();
+                    this._nodeIndex.clear();
+                    this._nodeMeta.clear();
+                    this._adj.clear();
                     this.connectionStart = null;
                     
                     document.getElementById('empty-state').style.display = 'block';
@@ -647,16 +807,8 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                     const workflowData = {{
                         name: workflowName,
                         description: `Workflow with ${{this.nodes.length}} nodes and ${{this.edges.length}} connections`,
-                        nodes: this.nodes.map(node => ({{
-                            id: node.id,
-                            agent_id: node.agent_id,
-                            position: node.position
-                        }})),
-                        edges: this.edges.map(edge => ({{
-                            id: edge.id,
-                            source_node_id: edge.source,
-                            target_node_id: edge.target
-                        }}))
+                        nodes: this.nodes,
+                        edges: this.edges
                     }};
                     
                     const endpoint = this.currentWorkflowId 
@@ -666,7 +818,7 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                     
                     const result = await this.apiCall(endpoint, {{
                         method: method,
-                        body: JSON.stringify(workflowData)
+                        body: await this.stringifyOffThread(workflowData)
                     }});
                     
                     if (result) {{
@@ -675,10 +827,13 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                         document.getElementById('current-workflow-name').textContent = this.currentWorkflowName;
                         
                         this.showSuccess(`Workflow "${{result.name}}" saved successfully!`);
-                        this.loadWorkflows(); // Refresh list
+                        this.loadWorkflows(true); // Refresh list
                     }}
                 }},
                 
+                // Serialize large payloads off the main thread
+                stringifyOffThread: offThread(data => JSON.stringify(data)),
+                
                 async loadWorkflowById(workflowId) {{
                     const workflow = await this.apiCall(`/workflows/${{workflowId}}`);
                     if (!workflow) return;
@@ -688,65 +843,52 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                     this.currentWorkflowName = workflow.name;
                     document.getElementById('current-workflow-name').textContent = this.currentWorkflowName;
                     
-                    // Load nodes
+                    // Load nodes into a fragment so the canvas is laid out once
                     if (workflow.nodes && workflow.nodes.length > 0) {{
+                        const frag = document.createDocumentFragment();
                         for (const nodeData of workflow.nodes) {{
-                            const agent = this.agents.find(a => a.id === nodeData.agent_id);
+                            const agent = this._agentById.get(nodeData.agent_id);
                             if (agent) {{
-                                this.addAgentNodeFromData(nodeData, agent);
+                                this.addAgentNodeFromData(nodeData, agent, frag);
                             }}
                         }}
+                        document.getElementById('nodes-container').appendChild(frag);
+                        if (this.nodes.length > 0) {{
+                            document.getElementById('empty-state').style.display = 'none';
+                        }}
                     }}
                     
-                    // Load edges
+                    // Load edges. Paths come from the stored node positions, so they can be
+                    // drawn straight away without waiting on a timer
                     if (workflow.edges && workflow.edges.length > 0) {{
-                        setTimeout(() => {{ // Wait for nodes to render
-                            workflow.edges.forEach(edgeData => {{
-                                this.edges.push(edgeData);
-                                this.drawConnection(edgeData);
+                        workflow.edges.forEach(edgeData => {{
+                            this.reserveId(edgeData.id);
+                            this.addEdge({{
+                                id: edgeData.id,
+                                source_node_id: edgeData.source_node_id,
+                                target_node_id: edgeData.target_node_id
                             }});
-                        }}, 100);
+                        }});
                     }}
                     
-                    this.renderWorkflowsList();
+                    this.renderWorkflowsListDebounced();
                     this.showSuccess(`Loaded workflow: ${{workflow.name}}`);
                 }},
                 
-                addAgentNodeFromData: function(nodeData, agent) {{
-                    const container = document.getElementById('nodes-container');
-                    
-                    const nodeDiv = document.createElement('div');
-                    nodeDiv.id = nodeData.id;
-                    nodeDiv.className = 'workflow-node';
-                    nodeDiv.style.cssText = `
-                        width: 180px; height: 70px;
-                        left: ${{nodeData.position.x}}px;
-                        top: ${{nodeData.position.y}}px;
-                        display: flex; align-items: center; justify-content: center;
-                    `;
-                    
-                    const emoji = this.getAgentEmoji(agent.name);
-                    nodeDiv.innerHTML = `
-                        <div class="node-handle input-handle" data-node-id="${{nodeData.id}}" data-handle="input"></div>
-                        <div style="text-align: center; pointer-events: none;">
-                            <div style="font-weight: bold; font-size: 12px;">${{emoji}} ${{agent.name}}</div>
-                            <div style="font-size: 9px; opacity: 0.8;">${{nodeData.id.substring(5, 11)}}</div>
-                        </div>
-                        <div class="node-handle output-handle" data-node-id="${{nodeData.id}}" data-handle="output"></div>
-                    `;
-                    
-                    this.makeNodeDraggable(nodeDiv);
-                    this.addNodeConnectionHandlers(nodeDiv);
-                    container.appendChild(nodeDiv);
+                addAgentNodeFromData: function(nodeData, agent, targetParent) {{
+                    const {{ x, y }} = nodeData.position;
+                    targetParent.appendChild(this.createNodeElement(nodeData.id, agent.name, x, y));
                     
-                    this.nodes.push({{
-                        id: nodeData.id,
-                        agent_id: agent.id,
-                        agent_name: agent.name,
-                        position: nodeData.position
-                    }});
-                    
-                    document.getElementById('empty-state').style.display = 'none';
+                    this.reserveId(nodeData.id);
+                    this.registerNode(nodeData.id, agent.id, agent.name, x, y);
+                }},
+                
+                // this.nodes holds exactly the saved shape; editor-only details go in _nodeMeta
+                registerNode: function(nodeId, agentId, agentName, x, y) {{
+                    const node = {{ id: nodeId, agent_id: agentId, position: {{ x, y }} }};
+                    this.nodes.push(node);
+                    this._nodeMeta.set(nodeId, {{ node, agentName }});
+                    this.updateNodePosition(nodeId, x, y);
                 }},
                 
                 async executeWorkflow() {{
@@ -779,13 +921,7 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                     }}
                     
                     // Check for isolated nodes
-                    const connectedNodes = new Set();
-                    this.edges.forEach(edge => {{
-                        connectedNodes.add(edge.source);
-                        connectedNodes.add(edge.target);
-                    }});
-                    
-                    const isolatedNodes = this.nodes.filter(node => !connectedNodes.has(node.id));
+                    const isolatedNodes = this.nodes.filter(node => !this._edgesByNode.has(node.id));
                     if (isolatedNodes.length > 0) {{
                         issues.push(`${{isolatedNodes.length}} isolated node(s)`);
                     }}
@@ -803,29 +939,36 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
                 }},
                 
                 hasCircularDependency: function() {{
-                    // Simple cycle detection using DFS
-                    const visited = new Set();
-                    const recursionStack = new Set();
+                    // A self-loop is a cycle on its own; otherwise a cycle needs at least two edges
+                    for (const edge of this.edges) {{
+                        if (edge.source_node_id === edge.target_node_id) return true;
+                    }}
+                    if (this.edges.length < 2) return false;
                     
-                    const hasCycle = (node) => {{
-                        if (recursionStack.has(node)) return true;
-                        if (visited.has(node)) return false;
-                        
-                        visited.add(node);
-                        recursionStack.add(node);
-                        
-                        const neighbors = this.edges.filter(e => e.source === node).map(e => e.target);
-                        for (const neighbor of neighbors) {{
-                            if (hasCycle(neighbor)) return true;
-                        }}
-                        
-                        recursionStack.delete(node);
-                        return false;
-                    }};
+                    // Iterative DFS with colour marking: 1 = on the stack, 2 = finished
+                    const color = new Map();
+                    const stack = [];
                     
                     for (const node of this.nodes) {{
-                        if (!visited.has(node.id) && hasCycle(node.id)) {{
-                            return true;
+                        if (color.has(node.id)) continue;
+                        color.set(node.id, 1);
+                        stack.push({{ id: node.id, i: 0 }});
+                        
+                        while (stack.length) {{
+                            const top = stack[stack.length - 1];
+                            const neighbors = this._adj.get(top.id) || [];
+                            if (top.i < neighbors.length) {{
+                                const next = neighbors[top.i++];
+                                const c = color.get(next);
+                                if (c === 1) return true;
+                                if (!c) {{
+                                    color.set(next, 1);
+                                    stack.push({{ id: next, i: 0 }});
+                                }}
+                            }} else {{
+                                color.set(top.id, 2);
+                                stack.pop();
+                            }}
                         }}
                     }}
                     
@@ -842,5 +985,3 @@ def workflow_editor_integrated(key="workflow_editor_integrated", height=800):
     </body>
     </html>
     """
-    
-    return components.html(component_html, height=height, scrolling=False)
\ No newline at end of file
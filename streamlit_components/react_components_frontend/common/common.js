@@ -0,0 +1,72 @@
+// Non-blocking stand-ins for alert/confirm/prompt shared by the component pages
+(function() {
+    let toast = null;
+    let toastTimer = 0;
+
+    window.showToast = function(message, kind) {
+        if (!toast) {
+            toast = document.createElement('div');
+            toast.id = 'toast';
+            toast.setAttribute('role', 'status');
+            document.body.appendChild(toast);
+        }
+        toast.textContent = message;
+        toast.dataset.kind = kind || 'info';
+        toast.classList.add('show');
+        clearTimeout(toastTimer);
+        toastTimer = setTimeout(() => toast.classList.remove('show'), 2000);
+    };
+
+    // Resolves with true (or the entered text) when accepted and null when cancelled
+    function openDialog(message, withInput) {
+        return new Promise(resolve => {
+            const dlg = document.createElement('dialog');
+            dlg.className = 'component-dialog';
+            const form = document.createElement('form');
+            form.method = 'dialog';
+
+            const text = document.createElement('p');
+            text.textContent = message;
+            const input = document.createElement('input');
+            input.type = 'text';
+            input.hidden = !withInput;
+
+            // OK is the only submit button, so Enter accepts and Escape cancels
+            const actions = document.createElement('div');
+            actions.className = 'component-dialog-actions';
+            const cancel = document.createElement('button');
+            cancel.type = 'button';
+            cancel.textContent = 'Cancel';
+            cancel.onclick = () => dlg.close('cancel');
+            const ok = document.createElement('button');
+            ok.value = 'ok';
+            ok.textContent = 'OK';
+            actions.append(cancel, ok);
+
+            form.append(text, input, actions);
+            dlg.appendChild(form);
+            dlg.addEventListener('close', () => {
+                const accepted = dlg.returnValue === 'ok';
+                dlg.remove();
+                resolve(accepted ? (withInput ? input.value : true) : null);
+            });
+            document.body.appendChild(dlg);
+            dlg.showModal();
+        });
+    }
+
+    window.askConfirm = message => openDialog(message, false).then(result => result !== null);
+    window.askText = message => openDialog(message, true);
+})();
+
+// Streamlit component protocol: announce readiness, then size the frame from the props
+(function() {
+    function sendToStreamlit(type, data) {
+        window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type }, data), '*');
+    }
+    window.addEventListener('message', (event) => {
+        if (!event.data || event.data.type !== 'streamlit:render') return;
+        sendToStreamlit('streamlit:setFrameHeight', { height: event.data.args.height });
+    });
+    sendToStreamlit('streamlit:componentReady', { apiVersion: 1 });
+})();
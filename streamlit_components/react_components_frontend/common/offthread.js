@@ -0,0 +1,57 @@
+// offThread(fn) returns an async version of fn whose calls run on one shared worker, so
+// heavy work (parsing, serializing, graph traversal) doesn't block the page. fn must be
+// self-contained because the worker is built from its source. Where blob: workers are
+// blocked, or the worker fails to start, calls run fn on the main thread instead.
+window.offThread = function(fn) {
+    // null until the first call, false once the worker is unavailable
+    let worker = null;
+    let nextId = 0;
+    const pending = new Map();
+
+    const runHere = args => Promise.resolve().then(() => fn(...args));
+
+    function startWorker() {
+        const src = `const fn = ${fn};
+onmessage = async (e) => {
+    try {
+        postMessage({ id: e.data.id, result: await fn(...e.data.args) });
+    } catch (error) {
+        postMessage({ id: e.data.id, error: error instanceof Error ? error.message : String(error) });
+    }
+};`;
+        try {
+            worker = new Worker(URL.createObjectURL(new Blob([src], { type: 'text/javascript' })));
+        } catch (error) {
+            console.warn('Worker unavailable, running on the main thread:', error);
+            worker = false;
+            return;
+        }
+        worker.onmessage = (e) => {
+            const call = pending.get(e.data.id);
+            pending.delete(e.data.id);
+            if (!call) return;
+            if ('error' in e.data) {
+                call.reject(new Error(e.data.error));
+            } else {
+                call.resolve(e.data.result);
+            }
+        };
+        worker.onerror = (e) => {
+            console.warn('Worker failed, running on the main thread:', e.message);
+            worker.terminate();
+            worker = false;
+            pending.forEach(call => runHere(call.args).then(call.resolve, call.reject));
+            pending.clear();
+        };
+    }
+
+    return function(...args) {
+        if (worker === null) startWorker();
+        if (!worker) return runHere(args);
+        const id = ++nextId;
+        return new Promise((resolve, reject) => {
+            pending.set(id, { resolve, reject, args });
+            worker.postMessage({ id, args });
+        });
+    };
+};
@@ -1,5 +1,7 @@
 import streamlit as st
 import requests
+import httpx
+import asyncio
 import pandas as pd
 import plotly.express as px
 from datetime import datetime, timedelta
@@ -39,13 +41,80 @@ else:
 def fetch_data(endpoint):
     """Fetch data from API with caching"""
     try:
-        response = requests.get(f"{API_BASE}/{endpoint}")
+        response = requests.get(f"{API_BASE}/{endpoint}", timeout=2.0)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
         st.error(f"Failed to fetch {endpoint}: {e}")
         return []
 
+async def _fetch_all(endpoints):
+    """Fetch several endpoints concurrently on one client, raising the first failure"""
+    async def fetch(client, endpoint):
+        response = await client.get(f"{API_BASE}/{endpoint}")
+        response.raise_for_status()
+        return response.json()
+
+    # Like requests, follow the API's redirect from /api/<name> to /api/<name>/
+    async with httpx.AsyncClient(follow_redirects=True, timeout=2.0) as client:
+        results = await asyncio.gather(*(fetch(client, endpoint) for endpoint in endpoints), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    return results
+
+@st.cache_data(ttl=30)
+def fetch_many(*endpoints):
+    """Fetch several endpoints in parallel with caching, so a cache miss costs one round trip.
+
+    Failures raise instead of returning empty data, so an outage is never cached.
+    """
+    return asyncio.run(_fetch_all(endpoints))
+
+@st.cache_data(ttl=5)
+def probe_health():
+    """Health check result: True/False for healthy/unhealthy, None if the API server is unreachable.
+
+    The short timeout keeps a hung server from stalling the whole script rerun.
+    """
+    try:
+        response = requests.get("http://localhost:8003/health", timeout=1.0)
+        return response.status_code == 200
+    except requests.exceptions.RequestException:
+        return None
+
+@st.cache_data(ttl=30)
+def activity_timeline_df(activities):
+    """Activity counts per day and type, cached so reruns skip the date parsing"""
+    # Only the two columns used, Arrow-backed (pyarrow ships with Streamlit) rather than object dtype
+    df = pd.DataFrame(activities, columns=['created_at', 'type']).convert_dtypes(dtype_backend='pyarrow')
+    # ISO8601 parses timestamps with and without fractional seconds in one pass
+    df['date'] = pd.to_datetime(df['created_at'], format='ISO8601').dt.floor('D')
+    return df.value_counts(['date', 'type']).reset_index(name='count').sort_values(['date', 'type'])
+
+@st.cache_data(ttl=30)
+def tool_usage_df(agents):
+    """Number of agents allowed to use each MCP tool"""
+    tools = pd.Series([tool for agent in agents for tool in agent.get('mcp_tool_permissions', [])], dtype=object)
+    return tools.value_counts().rename_axis('tool').reset_index(name='count')
+
+# Figures are cached on their (already aggregated) data so reruns skip Plotly's figure construction
+@st.cache_data(ttl=30)
+def activity_timeline_fig(activity_counts):
+    """Line chart of activity counts per day and type"""
+    return px.line(
+        activity_counts, 
+        x='date', 
+        y='count', 
+        color='type',
+        title="Activity Timeline"
+    )
+
+@st.cache_data(ttl=30)
+def tool_usage_fig(df_tools):
+    """Pie chart of how many agents may use each tool"""
+    return px.pie(df_tools, values='count', names='tool', title="Tool Usage Distribution")
+
 def main():
     st.title("🤖 AI Agent Platform - Unified Dashboard")
     st.markdown("*React UI components embedded in Streamlit*")
@@ -85,9 +154,11 @@ def show_overview():
     st.header("📊 Platform Overview")
     
     # Fetch data
-    agents = fetch_data("agents")
-    workflows = fetch_data("workflows")
-    activities = fetch_data("activities")
+    try:
+        agents, workflows, activities = fetch_many("agents", "workflows", "activities")
+    except httpx.HTTPError as e:
+        st.error(f"Failed to fetch overview data: {e}")
+        agents, workflows, activities = [], [], []
     
     # Metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -112,36 +183,16 @@ def show_overview():
     with col1:
         if activities:
             # Activity timeline
-            df_activities = pd.DataFrame(activities)
-            df_activities['created_at'] = pd.to_datetime(df_activities['created_at'])
-            df_activities['date'] = df_activities['created_at'].dt.date
-            
-            activity_counts = df_activities.groupby(['date', 'type']).size().reset_index(name='count')
-            
-            fig = px.line(
-                activity_counts, 
-                x='date', 
-                y='count', 
-                color='type',
-                title="Activity Timeline"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(activity_timeline_fig(activity_timeline_df(activities)), use_container_width=True)
         else:
             st.info("No activities data available")
     
     with col2:
         if agents:
             # Agent tools distribution
-            tool_counts = {}
-            for agent in agents:
-                tools = agent.get('mcp_tool_permissions', [])
-                for tool in tools:
-                    tool_counts[tool] = tool_counts.get(tool, 0) + 1
-            
-            if tool_counts:
-                df_tools = pd.DataFrame(list(tool_counts.items()), columns=['tool', 'count'])
-                fig = px.pie(df_tools, values='count', names='tool', title="Tool Usage Distribution")
-                st.plotly_chart(fig, use_container_width=True)
+            df_tools = tool_usage_df(agents)
+            if not df_tools.empty:
+                st.plotly_chart(tool_usage_fig(df_tools), use_container_width=True)
         else:
             st.info("No agents data available")
 
@@ -156,14 +207,13 @@ def show_system_status():
     st.header("🔧 System Status")
     
     # Health check
-    try:
-        health_response = requests.get("http://localhost:8003/health")
-        if health_response.status_code == 200:
-            st.success("✅ API Server: Healthy")
-        else:
-            st.error("❌ API Server: Unhealthy")
-    except:
+    healthy = probe_health()
+    if healthy:
+        st.success("✅ API Server: Healthy")
+    elif healthy is None:
         st.error("❌ API Server: Unreachable")
+    else:
+        st.error("❌ API Server: Unhealthy")
     
     # MCP Tools status
     st.subheader("MCP Tools Status")
@@ -5,6 +5,7 @@ Test script to verify all imports work correctly
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Setup path
@@ -30,21 +31,47 @@ tests = [
     ("streamlit_components.react_components", "Streamlit components"),
 ]
 
-passed = 0
-failed = 0
 
-for module_name, description in tests:
+def probe(module_name):
+    """Import a module, returning the exception instead of raising it"""
+    # Modules already loaded by an earlier import (e.g. fastapi via backend.main) are done
+    if module_name in sys.modules:
+        return None
     try:
         __import__(module_name)
+        return None
+    except Exception as e:
+        return e
+
+
+# Third-party packages are independent, so their imports run concurrently and their file
+# I/O overlaps. Project modules import each other and go one at a time afterwards, since
+# concurrent imports of interdependent modules can fail with a spurious _DeadlockError.
+project_packages = ("backend", "streamlit_components")
+module_names = [module_name for module_name, _ in tests]
+third_party = [name for name in module_names if name.split(".")[0] not in project_packages]
+
+with ThreadPoolExecutor(max_workers=8) as executor:
+    results = dict(zip(third_party, executor.map(probe, third_party)))
+for name in module_names:
+    if name not in results:
+        results[name] = probe(name)
+errors = [results[name] for name in module_names]
+
+passed = 0
+failed = 0
+
+for (module_name, description), error in zip(tests, errors):
+    if error is None:
         print(f"✅ {module_name:35} - {description}")
         passed += 1
-    except ImportError as e:
+    elif isinstance(error, ImportError):
         print(f"❌ {module_name:35} - {description}")
-        print(f"   Error: {e}")
+        print(f"   Error: {error}")
         failed += 1
-    except Exception as e:
+    else:
         print(f"⚠️  {module_name:35} - {description}")
-        print(f"   Error: {e}")
+        print(f"   Error: {error}")
         failed += 1
 
 print(f"\n📊 Results: {passed} passed, {failed} failed")
@@ -1,17 +1,27 @@
+import asyncio
+
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 from backend.main import app
-from backend.storage.file_storage import file_storage as storage
+from backend.storage.file_storage import FileStorage, file_storage as storage
 
 client = TestClient(app)
 
 
 @pytest.fixture(autouse=True)
-def clear_storage():
-    """Clear storage before each test"""
-    storage.agents.clear()
-    storage.workflows.clear()
-    storage.activities.clear()
+def clear_storage(tmp_path, monkeypatch):
+    """Point the shared storage at an empty directory for each test"""
+    for name, value in vars(FileStorage(data_dir=str(tmp_path))).items():
+        monkeypatch.setattr(storage, name, value)
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Async client on the app, for tests that send requests concurrently"""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
 
 
 def test_health_endpoint():
@@ -41,17 +51,19 @@ def test_create_agent():
     assert "created_at" in data
 
 
-def test_list_agents():
+@pytest.mark.asyncio
+async def test_list_agents(async_client):
     """Test agent listing endpoint"""
     # Create test agents
-    for i in range(3):
-        agent_data = {
+    await asyncio.gather(*[
+        async_client.post("/api/agents/", json={
             "name": f"Agent {i}",
             "instructions": f"Instructions {i}",
-        }
-        client.post("/api/agents/", json=agent_data)
+        })
+        for i in range(3)
+    ])
     
-    response = client.get("/api/agents/")
+    response = await async_client.get("/api/agents/")
     assert response.status_code == 200
     
     agents = response.json()
@@ -184,4 +196,70 @@ def test_execute_tool_action():
     data = response.json()
     assert data["tool_id"] == "email_tool"
     assert data["success"] is True
-    assert "result" in data
\ No newline at end of file
+    assert "result" in data
+
+def test_activity_websocket_pushes_new_activities():
+    """Test that activities recorded after connecting are pushed over the WebSocket"""
+    with client.websocket_connect("/api/activities/ws") as websocket:
+        client.post("/api/activities/", json={
+            "type": "tool_invocation",
+            "title": "Pushed Activity",
+            "description": "Recorded while subscribed"
+        })
+
+        data = websocket.receive_json()
+        assert data["title"] == "Pushed Activity"
+        assert data["type"] == "tool_invocation"
+
+        # Messages from the client are ignored; the feed keeps going
+        websocket.send_text("ping")
+        for i in range(2):
+            client.post("/api/activities/", json={
+                "type": "tool_invocation",
+                "title": f"Burst {i}",
+                "description": "Recorded back to back"
+            })
+        assert [websocket.receive_json()["title"] for _ in range(2)] == ["Burst 0", "Burst 1"]
+
+
+def test_activities_page_cursor():
+    """Test that the activities page endpoint walks the feed with a cursor"""
+    for i in range(3):
+        client.post("/api/activities/", json={
+            "type": "tool_invocation",
+            "title": f"Activity {i}",
+            "description": "Paged activity"
+        })
+
+    response = client.get("/api/activities/page?limit=2")
+    assert response.status_code == 200
+    first_page = response.json()
+    assert [a["title"] for a in first_page["items"]] == ["Activity 2", "Activity 1"]
+    assert first_page["next_cursor"] == first_page["items"][-1]["id"]
+
+    response = client.get(f"/api/activities/page?limit=2&cursor={first_page['next_cursor']}")
+    second_page = response.json()
+    assert [a["title"] for a in second_page["items"]] == ["Activity 0"]
+    assert second_page["next_cursor"] is None
+
+
+def test_activities_etag_not_modified():
+    """Test that an unchanged activity feed is answered with 304 Not Modified"""
+    client.post("/api/activities/", json={
+        "type": "tool_invocation",
+        "title": "Cached Activity",
+        "description": "Served once"
+    })
+
+    response = client.get("/api/activities/")
+    etag = response.headers["ETag"]
+    # Weak, since the gzip and identity encodings of the body share it
+    assert etag.startswith('W/"')
+
+    response = client.get("/api/activities/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # A proxy may strip the weak marker; the comparison is weak either way
+    response = client.get("/api/activities/", headers={"If-None-Match": etag[2:]})
+    assert response.status_code == 304
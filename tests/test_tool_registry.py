@@ -0,0 +1,22 @@
+from backend.mcp.tool_registry import parse_tool_calls
+
+
+def test_parse_tool_calls_nested_params():
+    """Test that tool call parameters are extracted whole, including nested objects"""
+    response = (
+        'Sending now.\n'
+        'TOOL_CALL:email_tool:send:{"to": "a@b.c", "meta": {"tags": ["x"]}, "body": "use } and {"}\n'
+        'TOOL_CALL:slack_tool:post:{"channel": "#general"}'
+    )
+    
+    assert parse_tool_calls(response) == [
+        ("email_tool", "send", '{"to": "a@b.c", "meta": {"tags": ["x"]}, "body": "use } and {"}'),
+        ("slack_tool", "post", '{"channel": "#general"}')
+    ]
+
+
+def test_parse_tool_calls_skips_unclosed_params():
+    """Test that a call whose parameters never close doesn't hide the calls after it"""
+    response = 'TOOL_CALL:a:b:{"x": 1\nTOOL_CALL:c:d:{"y": 2}'
+    
+    assert parse_tool_calls(response) == [("c", "d", '{"y": 2}')]